@@ -10,6 +10,7 @@ if str(ROOT) not in sys.path:
 
 from vc.issuer import issue
 from vc.verifier import verify
+from vc.jsonio import write_json
 
 
 def main() -> None:
@@ -46,8 +47,7 @@ def main() -> None:
 		print("   *", p)
 
 	outp.parent.mkdir(parents=True, exist_ok=True)
-	with outp.open("w", encoding="utf-8") as f:
-		json.dump(issued, f, ensure_ascii=False, indent=2)
+	write_json(outp, issued)
 	print("   -> Issued VC saved to:", str(outp))
 
 	print("4) Verifying proofs...")
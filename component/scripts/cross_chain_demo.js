@@ -112,15 +112,10 @@ async function demo() {
         });
         console.log('Block root updated on Chain 1:', root);
 
-        // Generate merkle proof for our commitment transaction
+        // Generate merkle proof for our commitment transaction; its leaf was already hashed above
         const txIndex = txs.indexOf(commitTx.transactionHash);
-        const leaf = web3_c1.utils.keccak256(
-            web3_c1.eth.abi.encodeParameters(
-                ['bytes32', 'uint256'],
-                [commitTx.transactionHash, txIndex]
-            )
-        );
-        const proof = tree.getHexProof(leaf);
+        const leaf = leaves[txIndex];
+        const proof = tree.getHexProof(leaf, txIndex);
 
         console.log('5. Cross-chain verification on Chain 2...');
         
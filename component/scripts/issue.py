@@ -11,6 +11,7 @@ if str(ROOT) not in sys.path:
 
 from vc.issuer import issue
 from vc.crypto import generate_private_key, private_key_to_address
+from vc.jsonio import write_json
 
 
 def main() -> None:
@@ -37,8 +38,7 @@ def main() -> None:
 	issued, proofs = issue(vc, keys_cfg)
 
 	outp.parent.mkdir(parents=True, exist_ok=True)
-	with outp.open("w", encoding="utf-8") as f:
-		json.dump(issued, f, ensure_ascii=False, indent=2)
+	write_json(outp, issued)
 
 	print("Issued VC written to:", str(outp))
 	print("Proofs:")
@@ -0,0 +1,88 @@
+import unittest
+from pathlib import Path
+import sys
+
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+
+# Ensure project root is on sys.path when running from anywhere
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+	sys.path.insert(0, str(ROOT))
+
+from vc.crypto import (
+	Eip712Domain,
+	build_document_typed_data,
+	build_section_typed_data,
+	document_digest,
+	generate_private_key,
+	hash_typed_data,
+	keccak256,
+	make_digest_signer,
+	private_key_to_address,
+	recover_digest_signer,
+	recover_typed_data_signer,
+	section_digest,
+	sign_typed_data,
+)
+
+
+DOMAINS = [
+	Eip712Domain(),
+	Eip712Domain(
+		name="RWA-VC Test",
+		version="2",
+		chainId=2 ** 64 + 5,
+		verifyingContract="0x5FbDB2315678afecb367f032d93F642f64180aa3",
+	),
+]
+PATHS = ["/credentialSubject/identity", "/credentialSubject/compliance", "/credentialSubject/custody"]
+
+
+class DigestMatchesEthAccountTest(unittest.TestCase):
+	"""The direct Section/Document digests must sign and recover exactly like eth-account's EIP-712 path."""
+
+	def setUp(self) -> None:
+		self.private_key = generate_private_key()
+		self.address = private_key_to_address(self.private_key)
+		self.sign = make_digest_signer(self.private_key)
+
+	def _check(self, digest: bytes, typed_data: dict) -> None:
+		encoded = encode_typed_data(full_message=typed_data)
+		self.assertEqual(digest, hash_typed_data(typed_data))
+		signature = self.sign(digest)
+		# RFC 6979 signatures are deterministic, so both signers must produce the same bytes
+		expected = Account.sign_message(encoded, private_key=self.private_key).signature
+		self.assertEqual(bytes.fromhex(signature[2:]), bytes(expected))
+		self.assertEqual(recover_digest_signer(digest, signature), self.address)
+		self.assertEqual(Account.recover_message(encoded, signature=signature), self.address)
+
+	def test_section_digest(self) -> None:
+		for domain in DOMAINS:
+			for path in PATHS:
+				section_hash = keccak256(path.encode("utf-8"))
+				typed_data = build_section_typed_data(domain, path, "0x" + section_hash.hex())
+				self._check(section_digest(domain, path, section_hash), typed_data)
+
+	def test_document_digest(self) -> None:
+		for domain in DOMAINS:
+			document_hash = keccak256(domain.name.encode("utf-8"))
+			typed_data = build_document_typed_data(domain, "0x" + document_hash.hex())
+			self._check(document_digest(domain, document_hash), typed_data)
+
+	def test_typed_data_wrappers_follow_declared_types(self) -> None:
+		typed_data = build_section_typed_data(DOMAINS[0], PATHS[0], "0x" + keccak256(b"x").hex())
+		typed_data["types"]["Section"].append({"name": "note", "type": "string"})
+		typed_data["message"]["note"] = "extra member"
+		del typed_data["domain"]["verifyingContract"]
+		del typed_data["types"]["EIP712Domain"][3]
+		typed_data["domain"]["chainId"] = "0x1"
+		signature, signer = sign_typed_data(self.private_key, typed_data)
+		self.assertEqual(signer, self.address)
+		encoded = encode_typed_data(full_message=typed_data)
+		self.assertEqual(Account.recover_message(encoded, signature=signature), self.address)
+		self.assertEqual(recover_typed_data_signer(typed_data, signature), self.address)
+
+
+if __name__ == "__main__":
+	unittest.main()
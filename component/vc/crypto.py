@@ -1,44 +1,61 @@
 import json
-from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
-
+import struct
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+import coincurve  # libsecp256k1 binding; signs/recovers a raw digest without eth-account's layers
+from coincurve.context import GLOBAL_CONTEXT as _SECP256K1_CONTEXT
+from Crypto.Hash import keccak as _keccak  # pycryptodome's C Keccak
+from eth_abi import encode as _abi_encode
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from eth_account.messages import encode_typed_data as _encode_typed_data  # eth-account >=0.10
-from eth_utils import keccak, to_hex
+from eth_utils import to_bytes, to_checksum_address, to_hex
 
 
 # Enable eth-account local signing (no external provider)
 Account.enable_unaudited_hdwallet_features()
 
 
+def keccak256(data: bytes) -> bytes:
+	"""Compute keccak256 of raw bytes and return the 32-byte digest."""
+	return _keccak.new(digest_bits=256, data=data).digest()
+
+
+# Shared encoder: json.dumps() with non-default options builds a new JSONEncoder on every call
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
 def to_canonical_json(data: Any) -> str:
 	"""Return canonical JSON string for hashing: sorted keys, compact separators.
 	This ensures deterministic keccak256 input.
 	"""
-	return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+	return _CANONICAL_ENCODER.encode(data)
+
+
+def canonical_json_bytes(data: Any) -> bytes:
+	"""Return UTF-8 canonical JSON bytes for data (the keccak256 input)."""
+	return to_canonical_json(data).encode("utf-8")
+
+
+def keccak256_hex(data: bytes) -> str:
+	"""Compute keccak256 of raw bytes and return 0x-prefixed hex."""
+	return "0x" + keccak256(data).hex()
 
 
 def keccak256_json(data: Any) -> str:
 	"""Compute keccak256(hash) of canonical JSON representation and return 0x-prefixed hex."""
-	canonical = to_canonical_json(data).encode("utf-8")
-	return to_hex(keccak(canonical))
+	return keccak256_hex(canonical_json_bytes(data))
 
 
-@dataclass
-class Eip712Domain:
+class Eip712Domain(NamedTuple):
 	name: str = "RWA-VC"
 	version: str = "1"
 	chainId: int = 1
 	verifyingContract: str = "0x0000000000000000000000000000000000000000"
 
 	def as_dict(self) -> Dict[str, Any]:
-		return {
-			"name": self.name,
-			"version": self.version,
-			"chainId": self.chainId,
-			"verifyingContract": self.verifyingContract,
-		}
+		return self._asdict()
 
 
 def build_section_typed_data(domain: Eip712Domain, path: str, section_hash_hex: str) -> Dict[str, Any]:
@@ -87,21 +104,104 @@ def build_document_typed_data(domain: Eip712Domain, document_hash_hex: str) -> D
 	}
 
 
+EIP712_DOMAIN_TYPEHASH = keccak256(
+	b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+SECTION_TYPEHASH = keccak256(b"Section(string path,bytes32 sectionHash)")
+DOCUMENT_TYPEHASH = keccak256(b"Document(bytes32 documentHash)")
+
+# Fixed encodeData layouts: typeHash || keccak(path) || sectionHash and typeHash || documentHash
+_SECTION_PACKER = struct.Struct(">32s32s32s")
+_DOCUMENT_PACKER = struct.Struct(">32s32s")
+
+
+@lru_cache(maxsize=64)
+def _domain_separator(name: str, version: str, chainId: int, verifyingContract: str) -> bytes:
+	"""Return the EIP-712 domain separator. It is invariant per domain, so it is computed once."""
+	return keccak256(_abi_encode(
+		["bytes32", "bytes32", "bytes32", "uint256", "address"],
+		[
+			EIP712_DOMAIN_TYPEHASH,
+			keccak256(name.encode("utf-8")),
+			keccak256(version.encode("utf-8")),
+			chainId,
+			verifyingContract,
+		],
+	))
+
+
+@lru_cache(maxsize=32)
+def _hash_string(value: str) -> bytes:
+	"""keccak256 of a string member. Section paths are a handful of constants, so memoize them."""
+	return keccak256(value.encode("utf-8"))
+
+
+def section_digest(domain: Eip712Domain, path: str, section_hash: bytes) -> bytes:
+	"""Return the EIP-712 signing digest for a Section message given the raw 32-byte section hash.
+	Equivalent to hash_typed_data(build_section_typed_data(...)) without the hex and dict round-trips.
+	"""
+	struct_hash = keccak256(_SECTION_PACKER.pack(SECTION_TYPEHASH, _hash_string(path), section_hash))
+	return keccak256(b"\x19\x01" + _domain_separator(*domain) + struct_hash)
+
+
+def document_digest(domain: Eip712Domain, document_hash: bytes) -> bytes:
+	"""Return the EIP-712 signing digest for a Document message given the raw 32-byte document hash."""
+	struct_hash = keccak256(_DOCUMENT_PACKER.pack(DOCUMENT_TYPEHASH, document_hash))
+	return keccak256(b"\x19\x01" + _domain_separator(*domain) + struct_hash)
+
+
+def hash_typed_data(typed_data: Dict[str, Any]) -> bytes:
+	"""Return the 32-byte EIP-712 signing digest of typed data, using eth-account's generic encoder.
+	issue()/verify() build the fixed Section/Document digests directly with section_digest()/document_digest().
+	"""
+	encoded = _encode_typed_data(full_message=typed_data)
+	return keccak256(b"\x19" + encoded.version + encoded.header + encoded.body)
+
+
+def make_digest_signer(private_key_hex: str) -> Callable[[bytes], str]:
+	"""Decode a private key once and return a sign(digest) -> signature_hex function for it.
+	The decoded key is held only by the returned function.
+	"""
+	# All keys share one libsecp256k1 context so its precomputed tables are built only once
+	key = coincurve.PrivateKey(to_bytes(hexstr=private_key_hex), context=_SECP256K1_CONTEXT)
+
+	def sign(digest: bytes) -> str:
+		# r || s || recovery id, with the id shifted to Ethereum's v = 27/28
+		sig = key.sign_recoverable(digest, hasher=None)
+		return to_hex(sig[:64] + bytes([sig[64] + 27]))
+
+	return sign
+
+
+def sign_digest(private_key_hex: str, digest: bytes) -> Tuple[str, str]:
+	"""Sign a 32-byte digest with a private key.
+	Returns tuple of (signature_hex, signer_address).
+	"""
+	return make_digest_signer(private_key_hex)(digest), private_key_to_address(private_key_hex)
+
+
+def recover_digest_signer(digest: bytes, signature_hex: str) -> str:
+	"""Recover signer address from a signature over a 32-byte digest."""
+	sig = to_bytes(hexstr=signature_hex)
+	if len(sig) != 65:
+		raise ValueError(f"Expected a 65-byte signature, got {len(sig)} bytes")
+	v = sig[64] - 27 if sig[64] >= 27 else sig[64]
+	public_key = coincurve.PublicKey.from_signature_and_message(
+		sig[:64] + bytes([v]), digest, hasher=None, context=_SECP256K1_CONTEXT
+	)
+	return to_checksum_address(keccak256(public_key.format(compressed=False)[1:])[-20:])
+
+
 def sign_typed_data(private_key_hex: str, typed_data: Dict[str, Any]) -> Tuple[str, str]:
 	"""Sign EIP-712 typed data with a private key.
 	Returns tuple of (signature_hex, signer_address).
 	"""
-	account: LocalAccount = Account.from_key(private_key_hex)
-	encoded = _encode_typed_data(full_message=typed_data)
-	signed = Account.sign_message(encoded, private_key=account.key)
-	return to_hex(signed.signature), account.address
+	return sign_digest(private_key_hex, hash_typed_data(typed_data))
 
 
 def recover_typed_data_signer(typed_data: Dict[str, Any], signature_hex: str) -> str:
 	"""Recover signer address from EIP-712 signature and typed data."""
-	encoded = _encode_typed_data(full_message=typed_data)
-	recovered = Account.recover_message(encoded, signature=signature_hex)
-	return recovered
+	return recover_digest_signer(hash_typed_data(typed_data), signature_hex)
 
 
 def generate_private_key() -> str:
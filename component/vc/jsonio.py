@@ -0,0 +1,8 @@
+import json
+from pathlib import Path
+from typing import Any
+
+
+def write_json(path: Path, data: Any) -> None:
+	"""Write pretty-printed JSON in a single write; json.dump() issues one write per token."""
+	path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
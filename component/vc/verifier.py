@@ -1,12 +1,12 @@
 from typing import Any, Dict, List, Tuple, Optional
-from copy import deepcopy
 
 from .crypto import (
 	Eip712Domain,
-	build_document_typed_data,
-	build_section_typed_data,
-	keccak256_json,
-	recover_typed_data_signer,
+	canonical_json_bytes,
+	document_digest,
+	keccak256,
+	recover_digest_signer,
+	section_digest,
 )
 
 SECTION_PATHS = [
@@ -14,33 +14,41 @@ SECTION_PATHS = [
 	"/credentialSubject/compliance",
 	"/credentialSubject/custody",
 ]
+# All sections live directly under /credentialSubject
+SECTION_KEYS = frozenset(path.rsplit("/", 1)[1] for path in SECTION_PATHS)
+# Pre-split section paths so lookups do not re-parse the path string on every call
+SECTION_PATH_PARTS = {path: tuple(p for p in path.split("/") if p) for path in SECTION_PATHS}
 
 
 def _get_by_path(doc: Dict[str, Any], path: str) -> Any:
-	parts = [p for p in path.split("/") if p]
+	parts = SECTION_PATH_PARTS.get(path)
+	if parts is None:
+		parts = tuple(p for p in path.split("/") if p)
 	cur: Any = doc
 	for p in parts:
-		if isinstance(cur, dict) and p in cur:
-			cur = cur[p]
-		else:
+		if not isinstance(cur, dict):
 			return None
+		cur = cur.get(p)
 	return cur
 
 
+def _without_keys(section: Any, keys: Tuple[str, ...]) -> Any:
+	if not isinstance(section, dict):
+		return section
+	return {k: v for k, v in section.items() if k not in keys}
+
+
 def _strip_eip712(vc: Dict[str, Any]) -> Dict[str, Any]:
-	doc = deepcopy(vc)
-	for path in SECTION_PATHS:
-		section = _get_by_path(doc, path)
-		if isinstance(section, dict):
-			if "sectionProof" in section:
-				section.pop("sectionProof", None)
-			if "sectionProofEip712" in section:
-				section.pop("sectionProofEip712", None)
-	if isinstance(doc, dict):
-		if "proof" in doc:
-			doc.pop("proof", None)
-		if "proofEip712" in doc:
-			doc.pop("proofEip712", None)
+	# Copies only the dicts that lose a proof; other subtrees are shared with vc
+	if not isinstance(vc, dict):
+		return vc
+	doc = {k: v for k, v in vc.items() if k not in ("proof", "proofEip712")}
+	subject = doc.get("credentialSubject")
+	if isinstance(subject, dict):
+		doc["credentialSubject"] = {
+			k: _without_keys(v, ("sectionProof", "sectionProofEip712")) if k in SECTION_KEYS else v
+			for k, v in subject.items()
+		}
 	return doc
 
 
@@ -73,7 +81,8 @@ def verify(vc: Dict[str, Any], expected_addresses: Optional[Dict[str, str]] = No
 			continue
 
 		section_clean = _get_by_path(clean, path) or {}
-		computed_hash = keccak256_json(section_clean)
+		computed = keccak256(canonical_json_bytes(section_clean))
+		computed_hash = "0x" + computed.hex()
 
 		domain_dict = proof.get("domain", {"name": "RWA-VC", "version": "1", "chainId": 1, "verifyingContract": "0x0000000000000000000000000000000000000000"})
 		domain = Eip712Domain(
@@ -82,10 +91,8 @@ def verify(vc: Dict[str, Any], expected_addresses: Optional[Dict[str, str]] = No
 			chainId=int(domain_dict.get("chainId", 1)),
 			verifyingContract=domain_dict.get("verifyingContract", "0x0000000000000000000000000000000000000000"),
 		)
-		typed = build_section_typed_data(domain, path=path, section_hash_hex=computed_hash)
-
 		signature = proof.get("proofValue", "")
-		recovered = recover_typed_data_signer(typed, signature)
+		recovered = recover_digest_signer(section_digest(domain, path, computed), signature)
 
 		expected_hash = proof.get("sectionHash")
 		hash_ok = computed_hash == expected_hash
@@ -114,8 +121,8 @@ def verify(vc: Dict[str, Any], expected_addresses: Optional[Dict[str, str]] = No
 		results.append({"path": "/", "ok": False, "reason": "missing proof"})
 		return results
 
-	clean_doc = _strip_eip712(vc)
-	computed_doc_hash = keccak256_json(clean_doc)
+	# vc is not modified during verification, so the stripped copy from the section pass is reused
+	computed_doc_hash = keccak256(canonical_json_bytes(clean))
 
 	domain_dict = proof_doc.get("domain", {"name": "RWA-VC", "version": "1", "chainId": 1, "verifyingContract": "0x0000000000000000000000000000000000000000"})
 	domain = Eip712Domain(
@@ -124,8 +131,7 @@ def verify(vc: Dict[str, Any], expected_addresses: Optional[Dict[str, str]] = No
 		chainId=int(domain_dict.get("chainId", 1)),
 		verifyingContract=domain_dict.get("verifyingContract", "0x0000000000000000000000000000000000000000"),
 	)
-	typed_doc = build_document_typed_data(domain, document_hash_hex=computed_doc_hash)
-	recovered_doc = recover_typed_data_signer(typed_doc, proof_doc.get("proofValue", ""))
+	recovered_doc = recover_digest_signer(document_digest(domain, computed_doc_hash), proof_doc.get("proofValue", ""))
 
 	expected_doc = (expected_addresses or {}).get("document")
 	expected_doc = proof_doc.get("signer") or expected_doc